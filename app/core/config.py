@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from pydantic import PostgresDsn, field_validator
@@ -19,6 +20,10 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = 'postgres'
     POSTGRES_DB: str = 'postgres'
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    SQLALCHEMY_POOL_SIZE: int = 10
+    SQLALCHEMY_MAX_OVERFLOW: int = 10
+    SQLALCHEMY_POOL_RECYCLE: int = 1800
+    SQLALCHEMY_POOL_TIMEOUT: int = 30
     API_V1_STR: str = '/api/v1'
     LOG_LEVEL: str = 'INFO'
     LOGGING_CONFIG: Dict[str, Any] = {
@@ -41,4 +46,9 @@ class Settings(BaseSettings):
         return PostgresDsn(postgres_dsn)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
@@ -5,14 +5,14 @@ from fastapi import Depends
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 
-from app.db import engine
+from app.db import SessionLocal
 
 logger = structlog.get_logger(__name__)
 security = HTTPBearer(auto_error=False)
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
 
 
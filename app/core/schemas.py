@@ -1,4 +1,4 @@
-from pydantic import UUID4, BaseModel
+from pydantic import UUID4, BaseModel, ConfigDict
 
 
 class Token(BaseModel):
@@ -7,6 +7,8 @@ class Token(BaseModel):
 
 
 class TokenPayload(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     exp: int
     sub: UUID4
 
@@ -13,7 +13,6 @@ def setup_logging(json_logs: bool = False, log_level: str = 'INFO'):
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.stdlib.ExtraAdder(),
         timestamper,
         structlog.processors.StackInfoRenderer(),
     ]
@@ -32,6 +31,10 @@ def setup_logging(json_logs: bool = False, log_level: str = 'INFO'):
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
+        # Drop events below the configured level before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(log_level.upper())
+        ),
         cache_logger_on_first_use=True,
     )
 
@@ -44,7 +47,9 @@ def setup_logging(json_logs: bool = False, log_level: str = 'INFO'):
     formatter = structlog.stdlib.ProcessorFormatter(
         # These run ONLY on `logging` entries that do NOT originate within
         # structlog.
-        foreign_pre_chain=shared_processors,
+        # `ExtraAdder` only has work to do on stdlib records, so keep it out
+        # of the chain every structlog event goes through.
+        foreign_pre_chain=shared_processors + [structlog.stdlib.ExtraAdder()],
         # These run on ALL entries after the pre_chain is done.
         processors=[
             # Remove _record & _from_structlog.
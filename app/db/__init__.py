@@ -1,8 +1,14 @@
 from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
 engine = create_engine(
     settings.SQLALCHEMY_DATABASE_URI.unicode_string(),
     pool_pre_ping=True,  # type: ignore
+    pool_size=settings.SQLALCHEMY_POOL_SIZE,
+    max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+    pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
 )
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
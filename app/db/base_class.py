@@ -1,9 +1,29 @@
+import secrets
+import time
 import uuid
 from datetime import datetime
 
+from sqlalchemy import func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Build an RFC 9562 version 7 UUID: a 48-bit millisecond timestamp
+    followed by 74 random bits, so ids sort by creation time and new rows
+    land at the right-hand edge of the index instead of a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    return uuid.UUID(
+        int=(timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -12,11 +32,11 @@ class BaseModel(Base):
     __abstract__ = True
     id: Mapped[int] = mapped_column(primary_key=True)
     external_id: Mapped[uuid.UUID] = mapped_column(
-        index=True, unique=True, default_factory=uuid.uuid4
+        index=True, unique=True, default=uuid7
     )
-    created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        default_factory=datetime.now, onupdate=datetime.now
+        server_default=func.now(), onupdate=func.now()
     )
 
     def __repr__(self):
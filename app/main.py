@@ -7,11 +7,10 @@ from asgi_correlation_id import CorrelationIdMiddleware, correlation_id
 from fastapi import Depends, FastAPI, Request, Response
 from fastapi.logger import logger as fastapi_logger
 from sqlalchemy import text
-from sqlalchemy.orm import Session
 from uvicorn.protocols.utils import get_path_with_query_string
 
-from app.core.config import settings
-from app.core.deps import get_db
+from app.core.config import Settings, get_settings, settings
+from app.core.deps import SessionDep
 from app.core.endpoints import router
 from app.custom_logging import setup_logging
 
@@ -19,6 +18,7 @@ logger = structlog.get_logger(__name__)
 
 setup_logging(json_logs=settings.JSON_LOGS, log_level=settings.LOG_LEVEL)
 access_logger = structlog.stdlib.get_logger('api.access')
+error_logger = structlog.stdlib.get_logger('api.error')
 
 
 def create_app():
@@ -32,7 +32,10 @@ def create_app():
     fastapi_app.include_router(router, prefix=settings.API_V1_STR)
 
     @fastapi_app.get('/healthcheck')
-    def healthcheck(db: Session = Depends(get_db)):
+    def healthcheck(
+        db: SessionDep,
+        app_settings: Settings = Depends(get_settings),
+    ):
         db_status = 'ok'
         try:
             db.execute(text('SELECT 1'))
@@ -40,7 +43,11 @@ def create_app():
             db_status = 'error'
             logger.error('Database is not available', exc_info=e)
 
-        return {'app': 'ok', 'db': db_status, 'version': settings.APP_VERSION}
+        return {
+            'app': 'ok',
+            'db': db_status,
+            'version': app_settings.APP_VERSION,
+        }
 
     return fastapi_app
 
@@ -60,9 +67,7 @@ async def logging_middleware(request: Request, call_next) -> Response:
     try:
         response = await call_next(request)
     except Exception:
-        structlog.stdlib.get_logger('api.error').exception(
-            'Uncaught exception'
-        )
+        error_logger.exception('Uncaught exception')
         raise
     finally:
         process_time = time.perf_counter_ns() - start_time
@@ -72,9 +77,10 @@ async def logging_middleware(request: Request, call_next) -> Response:
         client_port = request.client.port
         http_method = request.method
         http_version = request.scope['http_version']
+        duration = f'{process_time / 1_000_000:.2f}ms'
 
         access_logger.info(
-            f"""{client_host}:{client_port} - "{http_method} {url} HTTP/{http_version}" {status_code} {process_time / 1_000_000:.2f}ms""",
+            f"""{client_host}:{client_port} - "{http_method} {url} HTTP/{http_version}" {status_code} {duration}""",
             http={
                 'url': url,
                 'status_code': status_code,
@@ -83,7 +89,7 @@ async def logging_middleware(request: Request, call_next) -> Response:
                 'version': http_version,
             },
             network={'client': {'ip': client_host, 'port': client_port}},
-            duration=f'{process_time / 1_000_000:.2f}ms',
+            duration=duration,
         )
         response.headers['X-Process-Time'] = str(process_time / 1_000_000_000)
 
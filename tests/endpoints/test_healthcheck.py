@@ -2,9 +2,39 @@ from unittest import mock
 from unittest.mock import ANY
 
 import pytest
+from sqlalchemy import event
+
+from app.core.config import Settings, get_settings
+from app.db import engine
 
 
 def test_healthcheck(client):
     response = client.get('/healthcheck')
     assert response.status_code == 200
     assert response.json() == {'app': 'ok', 'db': 'ok', 'version': ANY}
+
+
+def test_healthcheck_uses_injected_settings(app, client):
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        APP_VERSION='9.9.9'
+    )
+
+    response = client.get('/healthcheck')
+    assert response.status_code == 200
+    assert response.json()['version'] == '9.9.9'
+
+
+def test_healthcheck_checks_out_a_single_connection(client):
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(engine, 'checkout', on_checkout)
+    try:
+        response = client.get('/healthcheck')
+    finally:
+        event.remove(engine, 'checkout', on_checkout)
+
+    assert response.status_code == 200
+    assert len(checkouts) == 1
@@ -0,0 +1,32 @@
+import time
+import uuid
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import BaseModel, uuid7
+
+
+class Sample(BaseModel):
+    __tablename__ = 'sample'
+    name: Mapped[str] = mapped_column()
+
+
+def test_base_model_fills_defaults_on_insert(db):
+    sample = Sample(name='sample')
+    db.add(sample)
+    db.commit()
+
+    assert sample.id is not None
+    assert sample.external_id is not None
+    assert sample.created_at is not None
+    assert sample.updated_at is not None
+
+
+def test_uuid7_is_time_ordered():
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second